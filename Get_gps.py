@@ -3,7 +3,8 @@ Example usage of PA1010D GPS library for Raspberry Pi Pico
 """
 
 import time
-from pA1010D_GPS import PA1010D
+import asyncio
+from pA1010D_GPS import PA1010D, WaypointTable
 
 # Initialize GPS module
 # Default pins: TX=GP0, RX=GP1, UART0
@@ -21,15 +22,19 @@ time.sleep(2)
 target_lat = 51.5074
 target_lon = -0.1278
 
-def main():
+# Distance/bearing functions specialised for the fixed target
+distance_to_target = gps.make_distance_to(target_lat, target_lon)
+bearing_to_target = gps.make_bearing_to(target_lat, target_lon)
+
+async def main():
     print("PA1010D GPS Test")
     print("Waiting for GPS fix...")
     
     last_fix_status = False
     
     while True:
-        # Update GPS data
-        if gps.update():
+        # Wait for and parse the next GPS data
+        if await gps.wait_update():
             # Check if we have a fix
             has_fix = gps.has_fix()
             
@@ -59,8 +64,8 @@ def main():
                 print(f"Date/Time: {date} {time_str}" if date and time_str else "Date/Time: N/A")
                 
                 # Calculate distance and bearing to target
-                distance = gps.distance_to(target_lat, target_lon)
-                bearing = gps.bearing_to(target_lat, target_lon)
+                distance = distance_to_target()
+                bearing = bearing_to_target()
                 
                 if distance is not None and bearing is not None:
                     print(f"Distance to London: {distance/1000:.2f} km")
@@ -71,14 +76,12 @@ def main():
                 satellites = gps.get_satellites()
                 print(f"Searching for satellites... ({satellites} visible)")
         
-        # Print last received sentence for debugging
-        if gps.last_sentence:
-            print(f"Last: {gps.last_sentence}")
-        
-        time.sleep(1)
+            # Print last received sentence for debugging
+            if gps.last_sentence:
+                print(f"Last: {gps.last_sentence}")
 
 # Advanced example showing continuous tracking
-def tracking_example():
+async def tracking_example():
     """Example of continuous GPS tracking with waypoint navigation"""
     
     # Define waypoints (example path)
@@ -88,18 +91,21 @@ def tracking_example():
         (41.9028, 12.4964),  # Rome
     ]
     
+    # Waypoint trig is computed once here, not on every update
+    table = WaypointTable(waypoints)
+    
     current_waypoint = 0
     
     print("Starting GPS tracking...")
     
     while True:
-        if gps.update() and gps.has_fix():
+        if await gps.wait_update() and gps.has_fix():
             lat, lon = gps.get_location()
             
             if current_waypoint < len(waypoints):
-                target_lat, target_lon = waypoints[current_waypoint]
-                distance = gps.distance_to(target_lat, target_lon)
-                bearing = gps.bearing_to(target_lat, target_lon)
+                # One batched call each per update
+                distance = gps.distances_to(table)[current_waypoint]
+                bearing = gps.bearings_to(table)[current_waypoint]
                 
                 print(f"Current: {lat:.6f}, {lon:.6f}")
                 print(f"Waypoint {current_waypoint + 1}: {distance/1000:.2f}km @ {bearing:.1f}°")
@@ -112,32 +118,29 @@ def tracking_example():
                     if current_waypoint >= len(waypoints):
                         print("Journey complete!")
                         break
-        
-        time.sleep(2)
 
 # Simple example for basic location reading
-def simple_example():
+async def simple_example():
     """Simple example that just prints location when available"""
     
     while True:
-        gps.update()
+        if not await gps.wait_update():
+            continue
         
         if gps.has_fix():
             lat, lon = gps.get_location()
             print(f"Location: {lat:.6f}, {lon:.6f}")
         else:
             print("Waiting for GPS fix...")
-            
-        time.sleep(3)
 
 if __name__ == "__main__":
     try:
         # Run the main example
-        main()
+        asyncio.run(main())
         
         # Uncomment to run other examples:
-        # simple_example()
-        # tracking_example()
+        # asyncio.run(simple_example())
+        # asyncio.run(tracking_example())
         
     except KeyboardInterrupt:
         print("\nShutting down...")
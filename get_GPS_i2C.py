@@ -3,9 +3,9 @@ Example usage of PA1010D GPS library for Raspberry Pi Pico (I2C Interface)
 """
 
 from machine import I2C, Pin
-from machine import Pin, PWM
+from machine import Pin, PWM, Timer
 import time
-from PA1010D import PA1010D
+from PA1010D import PA1010D, WaypointTable
 from pimoroni_i2c import PimoroniI2C
 from rgb_leds import set_color
 
@@ -38,6 +38,33 @@ time.sleep(2)
 target_lat = 51.5074
 target_lon = -0.1278
 
+# LED colours cycled while searching for satellites
+SEARCH_COLORS = ((128, 50, 50), (50, 128, 50), (50, 50, 128))
+search_step = 0
+searching = False
+led_timer = Timer()
+
+def search_led_tick(timer):
+    """Show the next searching colour (runs from the LED timer)"""
+    global search_step
+    red, green, blue = SEARCH_COLORS[search_step]
+    set_color(red, green, blue)
+    search_step = (search_step + 1) % len(SEARCH_COLORS)
+
+def start_search_leds():
+    """Start the searching animation on the LED timer so the GPS loop never blocks"""
+    global searching
+    if not searching:
+        led_timer.init(period=500, mode=Timer.PERIODIC, callback=search_led_tick)
+        searching = True
+
+def stop_search_leds():
+    """Stop the searching animation"""
+    global searching
+    if searching:
+        led_timer.deinit()
+        searching = False
+
 def check_i2c_connection():
     """Check I2C bus and GPS module connection"""
     print("Scanning I2C bus...")
@@ -70,87 +97,92 @@ def main():
     error_count = 0
     max_errors = 5
     
-    while True:
-        try:
-            # Update GPS data
-            if gps.update():
-                error_count = 0  # Reset error counter on successful read
+    try:
+        while True:
+            try:
+                # Update GPS data
+                if gps.update():
+                    error_count = 0  # Reset error counter on successful read
                 
-                # Check if we have a fix
-                has_fix = gps.has_fix()
+                    # Check if we have a fix
+                    has_fix = gps.has_fix()
                 
-                # Print status change
-                if has_fix != last_fix_status:
+                    # Searching animation runs only while there is no fix
                     if has_fix:
-                        print("\n*** GPS FIX ACQUIRED ***")
-                        set_color(0,255,255)
+                        stop_search_leds()
                     else:
-                        print("\n*** GPS FIX LOST ***")
-                        set_color(255,128,0)
-                    last_fix_status = has_fix
+                        start_search_leds()
+                
+                    # Print status change
+                    if has_fix != last_fix_status:
+                        if has_fix:
+                            print("\n*** GPS FIX ACQUIRED ***")
+                            set_color(0,255,255)
+                        else:
+                            print("\n*** GPS FIX LOST ***")
+                            set_color(255,128,0)
+                        last_fix_status = has_fix
                 
-                if has_fix:
-                    # Get location data
-                    set_color(0,255,200)
+                    if has_fix:
+                        # Get location data
+                        set_color(0,255,200)
                     
-                    lat, lon = gps.get_location()
-                    altitude = gps.get_altitude()
-                    speed = gps.get_speed()
-                    course = gps.get_course()
-                    satellites = gps.get_satellites()
-                    hdop = gps.get_hdop()
-                    date, time_str = gps.get_datetime()
+                        lat, lon = gps.get_location()
+                        altitude = gps.get_altitude()
+                        speed = gps.get_speed()
+                        course = gps.get_course()
+                        satellites = gps.get_satellites()
+                        hdop = gps.get_hdop()
+                        date, time_str = gps.get_datetime()
                     
-                    print(f"\n--- GPS Data ---")
-                    print(f"Position: {lat:.6f}°, {lon:.6f}°")
-                    print(f"Altitude: {altitude}m" if altitude else "Altitude: N/A")
-                    print(f"Speed: {speed:.1f} km/h" if speed else "Speed: N/A")
-                    print(f"Course: {course:.1f}°" if course else "Course: N/A")
-                    print(f"Satellites: {satellites}")
-                    print(f"HDOP: {hdop:.1f}" if hdop else "HDOP: N/A")
-                    print(f"Date/Time: {date} {time_str}" if date and time_str else "Date/Time: N/A")
+                        print(f"\n--- GPS Data ---")
+                        print(f"Position: {lat:.6f}°, {lon:.6f}°")
+                        print(f"Altitude: {altitude}m" if altitude else "Altitude: N/A")
+                        print(f"Speed: {speed:.1f} km/h" if speed else "Speed: N/A")
+                        print(f"Course: {course:.1f}°" if course else "Course: N/A")
+                        print(f"Satellites: {satellites}")
+                        print(f"HDOP: {hdop:.1f}" if hdop else "HDOP: N/A")
+                        print(f"Date/Time: {date} {time_str}" if date and time_str else "Date/Time: N/A")
                     
-                    # Calculate distance and bearing to target
-                    distance = gps.distance_to(target_lat, target_lon)
-                    bearing = gps.bearing_to(target_lat, target_lon)
+                        # Calculate distance and bearing to target
+                        distance = gps.distance_to(target_lat, target_lon)
+                        bearing = gps.bearing_to(target_lat, target_lon)
                     
-                    if distance is not None and bearing is not None:
-                        print(f"Distance to London: {distance/1000:.2f} km")
-                        print(f"Bearing to London: {bearing:.1f}°")
+                        if distance is not None and bearing is not None:
+                            print(f"Distance to London: {distance/1000:.2f} km")
+                            print(f"Bearing to London: {bearing:.1f}°")
                     
-                else:
-                    # No fix - show satellite count
-                    satellites = gps.get_satellites()
-                    print(f"Searching for satellites... ({satellites} visible)")
-                    set_color(128,50,50)
-                    time.sleep(0.5)
-                    set_color(50,128,50)
-                    time.sleep(0.5)
-                    set_color(50,50,128)
+                    else:
+                        # No fix - show satellite count
+                        satellites = gps.get_satellites()
+                        print(f"Searching for satellites... ({satellites} visible)")
                 
-                # Print last received sentence for debugging
-                if gps.last_sentence:
-                    print(f"Last: {gps.last_sentence}")
+                    # Print last received sentence for debugging
+                    if gps.last_sentence:
+                        print(f"Last: {gps.last_sentence}")
                     
-            else:
-                # No new data received
-                if not gps.is_connected():
-                    error_count += 1
-                    print(f"I2C communication error ({error_count}/{max_errors})")
+                else:
+                    # No new data received
+                    if not gps.is_connected():
+                        error_count += 1
+                        print(f"I2C communication error ({error_count}/{max_errors})")
                     
-                    if error_count >= max_errors:
-                        print("Too many I2C errors. Checking connection...")
-                        check_i2c_connection()
-                        error_count = 0
-                        time.sleep(2)
+                        if error_count >= max_errors:
+                            print("Too many I2C errors. Checking connection...")
+                            check_i2c_connection()
+                            error_count = 0
+                            time.sleep(2)
         
-        except KeyboardInterrupt:
-            break
-        except Exception as e:
-            print(f"Unexpected error: {e}")
-            time.sleep(1)
+            except KeyboardInterrupt:
+                break
+            except Exception as e:
+                print(f"Unexpected error: {e}")
+                time.sleep(1)
             
-        time.sleep(1)
+            time.sleep(1)
+    finally:
+        # Leave the LEDs alone once the loop exits (e.g. after Ctrl+C)
+        stop_search_leds()
 
 def i2c_diagnostic():
     """Run I2C diagnostic tests"""
@@ -205,15 +237,17 @@ def waypoint_navigation():
     """Example of waypoint navigation using I2C GPS"""
     
     # Define waypoints (example coordinates)
-    waypoints = [
+    waypoints = WaypointTable([
         (51.5074, -0.1278, "London"),
         (48.8566, 2.3522, "Paris"), 
         (41.9028, 12.4964, "Rome"),
         (40.7128, -74.0060, "New York")
-    ]
+    ])
     
     current_waypoint = 0
     waypoint_radius = 1000  # 1km radius to consider "reached"
+    approx_range = 10000  # Equirectangular is within a few cm of Haversine inside 10km
+    distance = None
     
     print("I2C GPS Waypoint Navigation")
     print("=" * 30)
@@ -222,10 +256,15 @@ def waypoint_navigation():
         try:
             if gps.update() and gps.has_fix():
                 lat, lon = gps.get_location()
-                target_lat, target_lon, name = waypoints[current_waypoint]
+                name = waypoints.names[current_waypoint]
                 
-                distance = gps.distance_to(target_lat, target_lon)
-                bearing = gps.bearing_to(target_lat, target_lon)
+                # Once close, the cheap approximation replaces the full formula
+                if distance is not None and distance < approx_range:
+                    distance = gps.distance_to_approx(waypoints.lat[current_waypoint],
+                                                      waypoints.lon[current_waypoint])
+                else:
+                    distance = gps.distance_to_precomputed(current_waypoint, waypoints)
+                bearing = gps.bearing_to_precomputed(current_waypoint, waypoints)
                 speed = gps.get_speed() or 0
                 
                 print(f"\nCurrent Position: {lat:.6f}, {lon:.6f}")
@@ -238,6 +277,7 @@ def waypoint_navigation():
                 if distance < waypoint_radius:
                     print(f"*** Reached {name}! ***")
                     current_waypoint += 1
+                    distance = None
                     
                     if current_waypoint >= len(waypoints):
                         print("Journey complete!")
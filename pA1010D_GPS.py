@@ -9,8 +9,168 @@ via UART and parse NMEA sentences to extract location data.
 
 import time
 import math
+import micropython
+from micropython import const
+from array import array
 from machine import UART, Pin
 
+try:
+    from ulab import numpy as np
+except ImportError:
+    try:
+        import numpy as np
+    except ImportError:
+        np = None  # Batch geo helpers fall back to pure Python
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None  # Only needed for wait_update()
+
+@micropython.viper
+def _checksum_matches(data: ptr8, star: int) -> bool:
+    """Compare the XOR of data[1:star] with the two hex digits after the '*'"""
+    calculated = 0
+    for i in range(1, star):  # Skip the '$'
+        calculated ^= data[i]
+        
+    h0 = data[star + 1]
+    h1 = data[star + 2]
+    
+    # Only 0-9, A-F and a-f are valid: other characters still decode to a
+    # value (e.g. 'G' -> 16 spills into the high nibble) and could match
+    l0 = h0 | 0x20  # Fold A-F onto a-f
+    l1 = h1 | 0x20
+    if not (h0 >= 0x30 and h0 <= 0x39) and not (l0 >= 0x61 and l0 <= 0x66):
+        return False
+    if not (h1 >= 0x30 and h1 <= 0x39) and not (l1 >= 0x61 and l1 <= 0x66):
+        return False
+        
+    # Decode without branches: letters have bit 6 set and sit 9 above
+    # their low nibble, digits have it clear (works for upper and lower case)
+    expected = (((h0 & 0x0F) + (h0 >> 6) * 9) << 4) | ((h1 & 0x0F) + (h1 >> 6) * 9)
+    return calculated == expected
+
+@micropython.viper
+def _find_byte(data: ptr8, start: int, end: int, value: int) -> int:
+    """Index of the first value in data[start:end], or -1 (MicroPython bytearray has no find)"""
+    for i in range(start, end):
+        if data[i] == value:
+            return i
+    return -1
+
+_DEG2RAD = 0.017453292519943295  # math.pi / 180
+_RAD2DEG = 57.29577951308232  # 180 / math.pi
+_R = 6371000.0  # Earth radius in meters
+_TWO_R = 2.0 * _R
+
+_MAX_FIELDS = const(24)  # Enough for every NMEA sentence the PA1010D emits
+_GGA = const(0x474741)  # b'GGA'
+_RMC = const(0x524D43)  # b'RMC'
+_FIELD_COUNT_GGA = const(15)
+_FIELD_COUNT_RMC = const(12)
+_RECENT_COUNT = const(4)  # Raw sentences kept for last_sentence/get_recent_sentences
+_SIGN = {0x4E: 1.0, 0x45: 1.0, 0x53: -1.0, 0x57: -1.0}  # N, E, S, W
+
+@micropython.native
+def _parse_int(buf, start, end):
+    """Parse an unsigned decimal field of buf without allocating; None if empty or invalid"""
+    if start >= end:
+        return None
+    value = 0
+    for i in range(start, end):
+        digit = buf[i] - 0x30
+        if digit < 0 or digit > 9:
+            return None
+        value = value * 10 + digit
+    return value
+
+@micropython.native
+def _parse_float(buf, start, end):
+    """Parse a decimal field of buf (e.g. b'-12.34') without allocating; None if empty or invalid"""
+    if start >= end:
+        return None
+    negative = buf[start] == 0x2D  # '-'
+    if negative:
+        start += 1
+        if start == end:
+            return None
+    value = 0
+    scale = 1
+    point = False
+    for i in range(start, end):
+        digit = buf[i] - 0x30
+        if 0 <= digit <= 9:
+            value = value * 10 + digit
+            if point:
+                scale *= 10
+        elif buf[i] == 0x2E and not point:  # '.'
+            point = True
+        else:
+            return None
+    return -value / scale if negative else value / scale
+
+def _is_space(byte):
+    """True for the ASCII whitespace str.strip() removes"""
+    return byte == 0x20 or 0x09 <= byte <= 0x0D
+
+def _decode_sentence(line):
+    """Decode a raw sentence for display; bytes that are not ASCII are shown escaped"""
+    try:
+        return line.decode('ascii')
+    except UnicodeError:
+        # MicroPython ignores the errors argument, so 'ignore' would still raise
+        return repr(bytes(line))
+
+def _field_byte(buf, start, end):
+    """First byte of a field, or 0 if the field is empty"""
+    return buf[start] if start < end else 0
+
+class WaypointTable:
+    """
+    Fixed set of waypoints stored as parallel arrays
+    
+    The target-side trig (radians, sin, cos) never changes, so it is
+    computed once here instead of on every GPS update.
+    """
+    
+    def __init__(self, waypoints):
+        """
+        Build the waypoint table
+        
+        Args:
+            waypoints (list): (latitude, longitude) or (latitude, longitude, name) tuples
+        """
+        self.lat = array('f')
+        self.lon = array('f')
+        self.lat_rad = []
+        self.sin_lat = []
+        self.cos_lat = []
+        self.lon_rad = []
+        self.names = []
+        
+        for i, waypoint in enumerate(waypoints):
+            lat, lon = waypoint[0], waypoint[1]
+            lat_rad = lat * _DEG2RAD
+            
+            self.lat.append(lat)
+            self.lon.append(lon)
+            self.lat_rad.append(lat_rad)
+            self.sin_lat.append(math.sin(lat_rad))
+            self.cos_lat.append(math.cos(lat_rad))
+            self.lon_rad.append(lon * _DEG2RAD)
+            self.names.append(waypoint[2] if len(waypoint) > 2 else f"Waypoint {i + 1}")
+            
+        if np is not None:
+            # ndarray columns let distances_to/bearings_to work on the whole table
+            self.lat_rad = np.array(self.lat_rad)
+            self.sin_lat = np.array(self.sin_lat)
+            self.cos_lat = np.array(self.cos_lat)
+            self.lon_rad = np.array(self.lon_rad)
+            
+    def __len__(self):
+        return len(self.names)
+
 class PA1010D:
     """
     PA1010D GPS module driver for MicroPython
@@ -52,10 +212,47 @@ class PA1010D:
         self.fix_quality = 0
         self.timestamp = None
         self.date = None
+        self._has_fix = False  # Cached by update()
         
         # Internal buffers
-        self._buffer = ""
-        self.last_sentence = ""
+        self._buffer = bytearray()
+        self._rx = bytearray(256)
+        self._rx_mv = memoryview(self._rx)
+        # Ring of raw recent sentences, decoded on access
+        self._recent = [None] * _RECENT_COUNT
+        self._recent_next = 0
+        
+        self._field_ends = [0] * _MAX_FIELDS
+        
+        # Distance/bearing cache, valid for the current position only
+        self._last_pos = None
+        self._geo_cache = {}
+        
+        # Interrupt-driven reception (falls back to polling if unsupported)
+        self._rx_flag = asyncio.ThreadSafeFlag() if hasattr(asyncio, 'ThreadSafeFlag') else None
+        self.rx_irq = self._setup_rx_irq()
+        
+    def _setup_rx_irq(self):
+        """
+        Register a UART receive interrupt that wakes wait_update()
+        
+        Returns:
+            bool: True if the port supports UART receive interrupts
+        """
+        # RXIDLE fires once per burst (i.e. per sentence group) where available
+        trigger = getattr(UART, 'IRQ_RXIDLE', None) or getattr(UART, 'IRQ_RX', None)
+        if self._rx_flag is None or trigger is None:
+            return False
+            
+        try:
+            self.uart.irq(handler=self._rx_isr, trigger=trigger)
+        except (AttributeError, TypeError, ValueError, OSError):
+            return False
+        return True
+        
+    def _rx_isr(self, uart):
+        """UART receive interrupt handler"""
+        self._rx_flag.set()
         
     def enable(self):
         """Enable GPS module if enable pin is configured"""
@@ -68,152 +265,219 @@ class PA1010D:
         if self.enable_pin:
             self.enable_pin.value(0)
             
-    def _checksum_valid(self, sentence):
-        """Verify NMEA sentence checksum"""
-        if '*' not in sentence:
-            return False
-            
-        data, checksum = sentence.split('*')
-        calculated = 0
-        for char in data[1:]:  # Skip the '$'
-            calculated ^= ord(char)
-            
-        try:
-            return calculated == int(checksum, 16)
-        except ValueError:
-            return False
-            
-    def _parse_coordinate(self, coord_str, direction):
+    def _strip_and_verify(self, sentence):
+        """
+        Verify NMEA sentence checksum and locate the end of the data
+        
+        Returns:
+            int: Index of the '*' ending the data, or -1 if the checksum is missing or wrong
+        """
+        star = _find_byte(sentence, 0, len(sentence), 0x2A)  # '*'
+        if star < 0 or len(sentence) != star + 3 or not _checksum_matches(sentence, star):
+            return -1
+        return star
+        
+    @micropython.native
+    def _split_fields(self, buf, end):
+        """
+        Record where each comma-separated field of buf[:end] ends
+        
+        Field k spans buf[self._field_ends[k - 1] + 1:self._field_ends[k]]
+        (field 0 starts at 0). No strings or lists are allocated.
+        
+        Returns:
+            int: Number of fields
+        """
+        ends = self._field_ends
+        count = 0
+        for i in range(end):
+            if buf[i] == 0x2C:  # ','
+                ends[count] = i
+                count += 1
+                if count == _MAX_FIELDS - 1:
+                    break
+        ends[count] = end
+        return count + 1
+        
+    @micropython.native
+    def _parse_coordinate(self, buf, start, end, direction):
         """Parse NMEA coordinate format (ddmm.mmmm) to decimal degrees"""
-        if not coord_str or not direction:
+        # Direction sign (N/E positive, S/W negative); missing is invalid
+        sign = _SIGN.get(direction)
+        if sign is None:
             return None
             
-        try:
-            # Convert ddmm.mmmm to decimal degrees
-            degrees = int(float(coord_str) / 100)
-            minutes = float(coord_str) - (degrees * 100)
-            decimal = degrees + minutes / 60.0
-            
-            # Apply direction (N/E positive, S/W negative)
-            if direction in ['S', 'W']:
-                decimal = -decimal
-                
-            return decimal
-        except (ValueError, TypeError):
+        value = _parse_float(buf, start, end)
+        if value is None:
             return None
             
-    def _parse_time(self, time_str):
+        # Convert ddmm.mmmm to decimal degrees (NMEA magnitudes are never negative)
+        degrees = int(value) // 100
+        return (degrees + (value - degrees * 100) / 60.0) * sign
+        
+    @micropython.native
+    def _parse_time(self, buf, start, end):
         """Parse NMEA time format (hhmmss.sss)"""
-        if not time_str or len(time_str) < 6:
+        if end - start < 6:
             return None
             
-        try:
-            hours = int(time_str[0:2])
-            minutes = int(time_str[2:4])
-            seconds = float(time_str[4:])
-            return f"{hours:02d}:{minutes:02d}:{seconds:06.3f}"
-        except (ValueError, IndexError):
+        hours = _parse_int(buf, start, start + 2)
+        minutes = _parse_int(buf, start + 2, start + 4)
+        seconds = _parse_float(buf, start + 4, end)
+        if hours is None or minutes is None or seconds is None:
             return None
-            
-    def _parse_date(self, date_str):
+        return f"{hours:02d}:{minutes:02d}:{seconds:06.3f}"
+        
+    @micropython.native
+    def _parse_date(self, buf, start, end):
         """Parse NMEA date format (ddmmyy)"""
-        if not date_str or len(date_str) < 6:
+        if end - start < 6:
             return None
             
-        try:
-            day = int(date_str[0:2])
-            month = int(date_str[2:4])
-            year = 2000 + int(date_str[4:6])  # Assume 20xx
-            return f"{year}-{month:02d}-{day:02d}"
-        except (ValueError, IndexError):
+        day = _parse_int(buf, start, start + 2)
+        month = _parse_int(buf, start + 2, start + 4)
+        year = _parse_int(buf, start + 4, start + 6)
+        if day is None or month is None or year is None:
             return None
-            
-    def _parse_gga(self, fields):
+        return f"{2000 + year}-{month:02d}-{day:02d}"  # Assume 20xx
+        
+    @micropython.native
+    def _parse_gga(self, buf, count):
         """Parse GPGGA sentence (GPS Fix Data)"""
-        if len(fields) < 15:
+        if count < _FIELD_COUNT_GGA:
             return
             
+        ends = self._field_ends
+        
         # Time
-        self.timestamp = self._parse_time(fields[1])
+        self.timestamp = self._parse_time(buf, ends[0] + 1, ends[1])
         
         # Position
-        self.latitude = self._parse_coordinate(fields[2], fields[3])
-        self.longitude = self._parse_coordinate(fields[4], fields[5])
+        self.latitude = self._parse_coordinate(buf, ends[1] + 1, ends[2],
+                                               _field_byte(buf, ends[2] + 1, ends[3]))
+        self.longitude = self._parse_coordinate(buf, ends[3] + 1, ends[4],
+                                                _field_byte(buf, ends[4] + 1, ends[5]))
+        self._position_changed()
         
         # Fix quality (0=invalid, 1=GPS fix, 2=DGPS fix)
-        try:
-            self.fix_quality = int(fields[6]) if fields[6] else 0
-        except ValueError:
-            self.fix_quality = 0
+        self.fix_quality = _parse_int(buf, ends[5] + 1, ends[6]) or 0
             
         # Number of satellites
-        try:
-            self.satellites = int(fields[7]) if fields[7] else 0
-        except ValueError:
-            self.satellites = 0
+        self.satellites = _parse_int(buf, ends[6] + 1, ends[7]) or 0
             
         # Horizontal dilution of precision
-        try:
-            self.hdop = float(fields[8]) if fields[8] else None
-        except ValueError:
-            self.hdop = None
+        self.hdop = _parse_float(buf, ends[7] + 1, ends[8])
             
         # Altitude
-        try:
-            self.altitude = float(fields[9]) if fields[9] else None
-        except ValueError:
-            self.altitude = None
+        self.altitude = _parse_float(buf, ends[8] + 1, ends[9])
             
-    def _parse_rmc(self, fields):
+    @micropython.native
+    def _parse_rmc(self, buf, count):
         """Parse GPRMC sentence (Recommended Minimum Course)"""
-        if len(fields) < 12:
+        if count < _FIELD_COUNT_RMC:
             return
             
+        ends = self._field_ends
+        
         # Time
-        self.timestamp = self._parse_time(fields[1])
+        self.timestamp = self._parse_time(buf, ends[0] + 1, ends[1])
         
         # Status (A=active, V=void)
-        status = fields[2]
-        if status != 'A':
+        if ends[2] - ends[1] != 2 or buf[ends[1] + 1] != 0x41:  # 'A'
             return  # Invalid data
             
         # Position
-        self.latitude = self._parse_coordinate(fields[3], fields[4])
-        self.longitude = self._parse_coordinate(fields[5], fields[6])
+        self.latitude = self._parse_coordinate(buf, ends[2] + 1, ends[3],
+                                               _field_byte(buf, ends[3] + 1, ends[4]))
+        self.longitude = self._parse_coordinate(buf, ends[4] + 1, ends[5],
+                                                _field_byte(buf, ends[5] + 1, ends[6]))
+        self._position_changed()
         
         # Speed (knots to km/h)
-        try:
-            speed_knots = float(fields[7]) if fields[7] else 0
-            self.speed = speed_knots * 1.852  # Convert to km/h
-        except ValueError:
-            self.speed = None
+        if ends[7] > ends[6] + 1:
+            speed_knots = _parse_float(buf, ends[6] + 1, ends[7])
+        else:
+            speed_knots = 0
+        self.speed = speed_knots * 1.852 if speed_knots is not None else None
             
         # Course
-        try:
-            self.course = float(fields[8]) if fields[8] else None
-        except ValueError:
-            self.course = None
+        self.course = _parse_float(buf, ends[7] + 1, ends[8])
             
         # Date
-        self.date = self._parse_date(fields[9])
+        self.date = self._parse_date(buf, ends[8] + 1, ends[9])
         
+    def _position_changed(self):
+        """Drop cached distance/bearing results when the position moves"""
+        position = (self.latitude, self.longitude)
+        if position != self._last_pos:
+            self._last_pos = position
+            self._geo_cache.clear()
+            
     def _parse_sentence(self, sentence):
-        """Parse a complete NMEA sentence"""
-        if not sentence.startswith('$') or not self._checksum_valid(sentence):
+        """Parse a complete NMEA sentence held in a bytearray"""
+        if sentence[0] != 0x24:  # '$'
+            return
+            
+        # Fields end where the checksum starts
+        end = self._strip_and_verify(sentence)
+        if end < 0:
             return
             
-        # Remove checksum
-        if '*' in sentence:
-            sentence = sentence.split('*')[0]
+        count = self._split_fields(sentence, end)
+        if self._field_ends[0] != 6:
+            return
             
-        fields = sentence.split(',')
-        sentence_type = fields[0][3:]  # Remove '$GP' prefix
+        # Sentence type from bytes 3-5 (after the '$GP' prefix)
+        sentence_type = (sentence[3] << 16) | (sentence[4] << 8) | sentence[5]
+        
+        if sentence_type == _GGA:
+            self._parse_gga(sentence, count)
+        elif sentence_type == _RMC:
+            self._parse_rmc(sentence, count)
+            
+    def _drain_lines(self):
+        """
+        Parse every complete line in the receive buffer
         
-        if sentence_type == 'GGA':
-            self._parse_gga(fields)
-        elif sentence_type == 'RMC':
-            self._parse_rmc(fields)
+        Returns:
+            bool: True if at least one line was processed
+        """
+        buf = self._buffer
+        size = len(buf)
+        processed = False
+        start = 0
+        idx = _find_byte(buf, 0, size, 0x0A)  # '\n'
+        while idx >= 0:
+            # Copy out the finished line without surrounding whitespace (kept in _recent)
+            first = start
+            end = idx
+            while first < end and _is_space(buf[first]):
+                first += 1
+            while end > first and _is_space(buf[end - 1]):
+                end -= 1
+            line = buf[first:end]
+            start = idx + 1
             
+            if line:
+                self._recent[self._recent_next] = line
+                self._recent_next = (self._recent_next + 1) % _RECENT_COUNT
+                self._parse_sentence(line)
+                processed = True
+                
+            idx = _find_byte(buf, start, size, 0x0A)
+            
+        # Drop all consumed lines with a single copy (MicroPython bytearrays
+        # do not support slice deletion)
+        if start:
+            self._buffer = buf[start:]
+            
+        if processed:
+            # Cheapest test first: fix_quality is 0 until the first fix
+            self._has_fix = (self.fix_quality > 0 and 
+                             self.latitude is not None and 
+                             self.longitude is not None)
+        return processed
+        
     def update(self):
         """
         Read and parse available GPS data
@@ -224,36 +488,46 @@ class PA1010D:
         if not self.uart.any():
             return False
             
-        # Read available data
-        data = self.uart.read()
-        if not data:
-            return False
+        # Read available data through the reusable receive buffer
+        received = False
+        while self.uart.any():
+            count = self.uart.readinto(self._rx)
+            if not count:
+                break
+            self._buffer.extend(self._rx_mv[:count])
+            received = True
             
-        # Add to buffer and process complete sentences
-        self._buffer += data.decode('utf-8', 'ignore')
+        if not received:
+            return False
+        return self._drain_lines()
         
-        processed = False
-        while '\n' in self._buffer:
-            line, self._buffer = self._buffer.split('\n', 1)
-            line = line.strip()
+    async def wait_update(self, poll_interval=0.1):
+        """
+        Wait for GPS data to arrive, then read and parse it
+        
+        Sleeps on the UART receive interrupt when available, otherwise
+        polls every poll_interval seconds.
+        
+        Args:
+            poll_interval (float): Polling period when no interrupt is available
             
-            if line:
-                self.last_sentence = line
-                self._parse_sentence(line)
-                processed = True
-                
-        return processed
+        Returns:
+            bool: True if new data was processed, False otherwise
+        """
+        if self.rx_irq:
+            await self._rx_flag.wait()
+        else:
+            await asyncio.sleep(poll_interval)
+        return self.update()
         
     def has_fix(self):
         """
         Check if GPS has a valid fix
         
         Returns:
-            bool: True if GPS has valid position data
+            bool: True if GPS had valid position data at the last update()
         """
-        return (self.fix_quality > 0 and 
-                self.latitude is not None and 
-                self.longitude is not None)
+        return self._has_fix
                 
     def get_location(self):
         """
@@ -311,6 +585,80 @@ class PA1010D:
         """
         return (self.date, self.timestamp)
         
+    @property
+    def last_sentence(self):
+        """
+        Get the most recently received NMEA sentence
+        
+        Returns:
+            str: Sentence text or empty string if nothing received yet
+        """
+        line = self._recent[(self._recent_next - 1) % _RECENT_COUNT]
+        if line is None:
+            return ""
+        return _decode_sentence(line)
+        
+    def get_recent_sentences(self):
+        """
+        Get the last few NMEA sentences received
+        
+        Returns:
+            list: Up to 4 sentence strings, oldest first
+        """
+        sentences = []
+        for i in range(_RECENT_COUNT):
+            line = self._recent[(self._recent_next + i) % _RECENT_COUNT]
+            if line is not None:
+                sentences.append(_decode_sentence(line))
+        return sentences
+        
+    def _geo(self, target_lat, target_lon):
+        """
+        Calculate distance and bearing to a target from shared trig terms
+        
+        Results are cached per target until the position changes.
+        
+        Returns:
+            tuple: (distance in meters, bearing in degrees)
+        """
+        key = (target_lat, target_lon)
+        result = self._geo_cache.get(key)
+        if result is not None:
+            return result
+            
+        lat1_rad = self.latitude * _DEG2RAD
+        lat2_rad = target_lat * _DEG2RAD
+        sin_lat1 = math.sin(lat1_rad)
+        cos_lat1 = math.cos(lat1_rad)
+        sin_lat2 = math.sin(lat2_rad)
+        cos_lat2 = math.cos(lat2_rad)
+        delta_lat = lat2_rad - lat1_rad
+        delta_lon = (target_lon - self.longitude) * _DEG2RAD
+        sin_dlon = math.sin(delta_lon)
+        cos_dlon = math.cos(delta_lon)
+        
+        # hav(dlon) from the sin/cos the bearing needs anyway. (1 - cos) / 2
+        # cancels badly for short distances, so below 90 degrees use the
+        # equivalent sin^2 / (2 * (1 + cos)) instead
+        if cos_dlon > 0:
+            hav_dlon = sin_dlon * sin_dlon / (2 * (1 + cos_dlon))
+        else:
+            hav_dlon = (1 - cos_dlon) / 2
+            
+        # Haversine formula
+        a = math.sin(delta_lat / 2) ** 2 + cos_lat1 * cos_lat2 * hav_dlon
+        a = 1.0 if a > 1.0 else a  # Rounding can push a just past 1
+        c = 2.0 * math.asin(math.sqrt(a))
+        
+        # Initial bearing, normalized to 0-359.9
+        y = sin_dlon * cos_lat2
+        x = cos_lat1 * sin_lat2 - sin_lat1 * cos_lat2 * cos_dlon
+        bearing_deg = (math.atan2(y, x) * _RAD2DEG + 360) % 360
+        
+        result = (_R * c, bearing_deg)
+        self._geo_cache[key] = result
+        return result
+        
     def distance_to(self, target_lat, target_lon):
         """
         Calculate distance to target coordinates using Haversine formula
@@ -325,49 +673,245 @@ class PA1010D:
         if not self.has_fix():
             return None
             
-        # Haversine formula
-        R = 6371000  # Earth radius in meters
+        return self._geo(target_lat, target_lon)[0]
         
-        lat1_rad = math.radians(self.latitude)
-        lat2_rad = math.radians(target_lat)
-        delta_lat = math.radians(target_lat - self.latitude)
-        delta_lon = math.radians(target_lon - self.longitude)
+    def bearing_to(self, target_lat, target_lon):
+        """
+        Calculate bearing to target coordinates
         
-        a = (math.sin(delta_lat / 2) ** 2 + 
-             math.cos(lat1_rad) * math.cos(lat2_rad) * 
-             math.sin(delta_lon / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+        Args:
+            target_lat (float): Target latitude
+            target_lon (float): Target longitude
+            
+        Returns:
+            float: Bearing in degrees (0-359.9) or None if no current position
+        """
+        if not self.has_fix():
+            return None
+            
+        return self._geo(target_lat, target_lon)[1]
         
-        return R * c
+    def make_distance_to(self, target_lat, target_lon):
+        """
+        Build a distance function specialised for one fixed target
         
-    def bearing_to(self, target_lat, target_lon):
+        The target-side trig is evaluated once here, so each call of the
+        returned function only works out the current-position terms.
+        
+        Args:
+            target_lat (float): Target latitude
+            target_lon (float): Target longitude
+            
+        Returns:
+            function: No-argument function returning the distance in meters
+            or None if no current position
         """
-        Calculate bearing to target coordinates
+        lat2_rad = target_lat * _DEG2RAD
+        lon2_rad = target_lon * _DEG2RAD
+        cos_lat2 = math.cos(lat2_rad)
+        
+        def distance():
+            if not self.has_fix():
+                return None
+                
+            lat1_rad = self.latitude * _DEG2RAD
+            delta_lon = lon2_rad - self.longitude * _DEG2RAD
+            
+            a = (math.sin((lat2_rad - lat1_rad) / 2) ** 2 + 
+                 math.cos(lat1_rad) * cos_lat2 * math.sin(delta_lon / 2) ** 2)
+            a = 1.0 if a > 1.0 else a  # Rounding can push a just past 1
+            return _TWO_R * math.asin(math.sqrt(a))
+            
+        return distance
+        
+    def make_bearing_to(self, target_lat, target_lon):
+        """
+        Build a bearing function specialised for one fixed target
+        
+        Args:
+            target_lat (float): Target latitude
+            target_lon (float): Target longitude
+            
+        Returns:
+            function: No-argument function returning the bearing in degrees
+            (0-359.9) or None if no current position
+        """
+        lat2_rad = target_lat * _DEG2RAD
+        lon2_rad = target_lon * _DEG2RAD
+        sin_lat2 = math.sin(lat2_rad)
+        cos_lat2 = math.cos(lat2_rad)
+        
+        def bearing():
+            if not self.has_fix():
+                return None
+                
+            lat1_rad = self.latitude * _DEG2RAD
+            delta_lon = lon2_rad - self.longitude * _DEG2RAD
+            
+            y = math.sin(delta_lon) * cos_lat2
+            x = (math.cos(lat1_rad) * sin_lat2 - 
+                 math.sin(lat1_rad) * cos_lat2 * math.cos(delta_lon))
+            return (math.atan2(y, x) * _RAD2DEG + 360) % 360
+            
+        return bearing
+        
+    def distance_to_approx(self, target_lat, target_lon):
+        """
+        Approximate distance to nearby target coordinates
+        
+        Uses the equirectangular projection, which stays within a few
+        centimeters of the Haversine result up to about 10 km (below 80°
+        latitude), so it suits radius checks and short-range navigation.
         
         Args:
             target_lat (float): Target latitude
             target_lon (float): Target longitude
             
+        Returns:
+            float: Distance in meters or None if no current position
+        """
+        if not self.has_fix():
+            return None
+            
+        # Take the short way round across the antimeridian
+        delta_lon = target_lon - self.longitude
+        if delta_lon > 180:
+            delta_lon -= 360
+        elif delta_lon < -180:
+            delta_lon += 360
+            
+        x = delta_lon * _DEG2RAD * math.cos((self.latitude + target_lat) / 2 * _DEG2RAD)
+        y = (target_lat - self.latitude) * _DEG2RAD
+        
+        return _R * math.sqrt(x * x + y * y)
+        
+    def distance_to_precomputed(self, idx, table):
+        """
+        Calculate distance to a waypoint using its precomputed trig
+        
+        Args:
+            idx (int): Index of the waypoint in the table
+            table (WaypointTable): Waypoint table
+            
+        Returns:
+            float: Distance in meters or None if no current position
+        """
+        if not self.has_fix():
+            return None
+            
+        lat1_rad = self.latitude * _DEG2RAD
+        delta_lat = table.lat_rad[idx] - lat1_rad
+        delta_lon = table.lon_rad[idx] - self.longitude * _DEG2RAD
+        
+        a = (math.sin(delta_lat / 2) ** 2 + 
+             math.cos(lat1_rad) * table.cos_lat[idx] * 
+             math.sin(delta_lon / 2) ** 2)
+        a = 1.0 if a > 1.0 else a  # Rounding can push a just past 1
+        c = 2.0 * math.asin(math.sqrt(a))
+        
+        return _R * c
+        
+    def bearing_to_precomputed(self, idx, table):
+        """
+        Calculate bearing to a waypoint using its precomputed trig
+        
+        Args:
+            idx (int): Index of the waypoint in the table
+            table (WaypointTable): Waypoint table
+            
         Returns:
             float: Bearing in degrees (0-359.9) or None if no current position
         """
         if not self.has_fix():
             return None
             
-        lat1_rad = math.radians(self.latitude)
-        lat2_rad = math.radians(target_lat)
-        delta_lon_rad = math.radians(target_lon - self.longitude)
+        lat1_rad = self.latitude * _DEG2RAD
+        delta_lon_rad = table.lon_rad[idx] - self.longitude * _DEG2RAD
+        cos_lat2 = table.cos_lat[idx]
         
-        y = math.sin(delta_lon_rad) * math.cos(lat2_rad)
-        x = (math.cos(lat1_rad) * math.sin(lat2_rad) - 
-             math.sin(lat1_rad) * math.cos(lat2_rad) * math.cos(delta_lon_rad))
+        y = math.sin(delta_lon_rad) * cos_lat2
+        x = (math.cos(lat1_rad) * table.sin_lat[idx] - 
+             math.sin(lat1_rad) * cos_lat2 * math.cos(delta_lon_rad))
         
-        bearing_rad = math.atan2(y, x)
-        bearing_deg = math.degrees(bearing_rad)
+        bearing_deg = math.atan2(y, x) * _RAD2DEG
         
         # Normalize to 0-359.9
         return (bearing_deg + 360) % 360
         
+    def distances_to(self, table):
+        """
+        Calculate distances to every waypoint of a table in one pass
+        
+        Uses numpy (ulab on MicroPython) when available, otherwise a
+        map() over the precomputed columns with the current-position trig hoisted.
+        
+        Args:
+            table (WaypointTable): Waypoint table
+            
+        Returns:
+            list/ndarray: Distances in meters or None if no current position
+        """
+        if not self.has_fix():
+            return None
+            
+        lat1_rad = self.latitude * _DEG2RAD
+        lon1_rad = self.longitude * _DEG2RAD
+        cos_lat1 = math.cos(lat1_rad)
+        
+        if np is not None:
+            delta_lat = table.lat_rad - lat1_rad
+            delta_lon = table.lon_rad - lon1_rad
+            
+            a = (np.sin(delta_lat / 2) ** 2 +
+                 cos_lat1 * table.cos_lat * np.sin(delta_lon / 2) ** 2)
+            a = np.minimum(a, 1.0)  # Rounding can push a just past 1
+            return _TWO_R * np.arcsin(np.sqrt(a))
+            
+        sin = math.sin
+        
+        def haversine(lat2_rad, cos_lat2, lon2_rad):
+            a = (sin((lat2_rad - lat1_rad) / 2) ** 2 +
+                 cos_lat1 * cos_lat2 * sin((lon2_rad - lon1_rad) / 2) ** 2)
+            a = 1.0 if a > 1.0 else a  # Rounding can push a just past 1
+            return _TWO_R * math.asin(math.sqrt(a))
+            
+        return list(map(haversine, table.lat_rad, table.cos_lat, table.lon_rad))
+        
+    def bearings_to(self, table):
+        """
+        Calculate bearings to every waypoint of a table in one pass
+        
+        Args:
+            table (WaypointTable): Waypoint table
+            
+        Returns:
+            list/ndarray: Bearings in degrees (0-359.9) or None if no current position
+        """
+        if not self.has_fix():
+            return None
+            
+        lat1_rad = self.latitude * _DEG2RAD
+        lon1_rad = self.longitude * _DEG2RAD
+        sin_lat1 = math.sin(lat1_rad)
+        cos_lat1 = math.cos(lat1_rad)
+        
+        if np is not None:
+            delta_lon = table.lon_rad - lon1_rad
+            
+            y = np.sin(delta_lon) * table.cos_lat
+            x = cos_lat1 * table.sin_lat - sin_lat1 * table.cos_lat * np.cos(delta_lon)
+            return (np.degrees(np.arctan2(y, x)) + 360) % 360
+            
+        sin, cos = math.sin, math.cos
+        
+        def bearing(sin_lat2, cos_lat2, lon2_rad):
+            delta_lon = lon2_rad - lon1_rad
+            y = sin(delta_lon) * cos_lat2
+            x = cos_lat1 * sin_lat2 - sin_lat1 * cos_lat2 * cos(delta_lon)
+            return (math.atan2(y, x) * _RAD2DEG + 360) % 360
+            
+        return list(map(bearing, table.sin_lat, table.cos_lat, table.lon_rad))
+        
     def __str__(self):
         """String representation of GPS status"""
         if self.has_fix():
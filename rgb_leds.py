@@ -7,13 +7,16 @@ pwms = [PWM(Pin(pin,Pin.OUT)) for pin in pins]
 for pwm in pwms:
     pwm.freq(1000)
 
+# 8-bit colour -> 16-bit duty lookup, built once at import
+_LUT = tuple(i * 65535 // 255 for i in range(256))
+
 def map_color(color):
     return int(color * 65535 / 255)
 
 def set_color(red, green, blue):
-    pwms[0].duty_u16(map_color(red))
-    pwms[1].duty_u16(map_color(green))
-    pwms[2].duty_u16(map_color(blue))
+    pwms[0].duty_u16(_LUT[red & 0xFF])
+    pwms[1].duty_u16(_LUT[green & 0xFF])
+    pwms[2].duty_u16(_LUT[blue & 0xFF])
 
 set_color(255, 0, 0)
 sleep(0.2)